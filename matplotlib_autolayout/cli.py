@@ -33,11 +33,19 @@ from matplotlib_autolayout import generate_source_code
     "corresponds to this many inches. Overrides `height`.",
 )
 @click.option("-d", "--dpi", default=96.0, help="Dots-per-inch of the figure")
-def main(art_file: IO, show: Optional[bool], **kwargs: Any) -> None:
+@click.option(
+    "--pyplot/--no-pyplot",
+    default=True,
+    help="Create the figure through pyplot, or as a bare figure with an Agg canvas."
+    " `--no-pyplot` cannot be used with `--show`.",
+)
+def main(art_file: IO, show: Optional[bool], pyplot: bool, **kwargs: Any) -> None:
     """
     Reads the layout ascii-art from a file (or stdin) and
     generates the necessary matplotlib code.
     """
+    if show and not pyplot:
+        raise click.UsageError("--show requires --pyplot")
 
     print("Enter ascii-art for plot layout, empty line to confirm", file=sys.stderr)
     rows = []
@@ -47,7 +55,9 @@ def main(art_file: IO, show: Optional[bool], **kwargs: Any) -> None:
         rows.append(row)
 
     src = StringIO()
-    generate_source_code("\n".join(rows), annotate=True, file=src, **kwargs)
+    generate_source_code(
+        "\n".join(rows), annotate=True, file=src, pyplot=pyplot, **kwargs
+    )
     src.seek(0)
     print(src.read())
 
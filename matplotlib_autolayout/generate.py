@@ -28,6 +28,7 @@ def generate_source_code(
     width_factor: Optional[float] = None,
     height_factor: Optional[float] = None,
     dpi: float = 96,
+    pyplot: bool = True,
 ) -> None:
     """
     Given the ascii-art representation of the plot's layout,
@@ -69,6 +70,11 @@ def generate_source_code(
     dpi (float, optional):
         DPI (dots-per-inch of the figure). Defaults to 96.
 
+    pyplot (bool, optional):
+        Whether to create the figure through pyplot. If False, the code creates a
+        bare `Figure` attached to an Agg canvas, without touching pyplot's global
+        state. Defaults to True.
+
     Returns
     -------
     None. The source code is written in `file`.
@@ -79,7 +85,12 @@ def generate_source_code(
     tree.sort_axes()
 
     file.write("import matplotlib as mpl\n")
-    file.write("import matplotlib.pyplot as plt\n")
+    if pyplot:
+        file.write("import matplotlib.pyplot as plt\n")
+    else:
+        file.write("import matplotlib.gridspec\n")
+        file.write("from matplotlib.backends.backend_agg import FigureCanvasAgg\n")
+        file.write("from matplotlib.figure import Figure\n")
 
     if width_factor is not None:
         if width is not None:
@@ -93,7 +104,11 @@ def generate_source_code(
             )
         height = height_factor * tree.height
 
-    file.write(f"fig = plt.figure(figsize=({width}, {height}), dpi={dpi})\n\n")
+    if pyplot:
+        file.write(f"fig = plt.figure(figsize=({width}, {height}), dpi={dpi})\n\n")
+    else:
+        file.write(f"fig = Figure(figsize=({width}, {height}), dpi={dpi})\n")
+        file.write("FigureCanvasAgg(fig)\n\n")
     file.write("gridspecs = {}\n")
     file.write("axes = {}\n")
 
@@ -113,6 +128,7 @@ def generate_layout(
     width_factor: Optional[float] = None,
     height_factor: Optional[float] = None,
     dpi: float = 96,
+    pyplot: bool = True,
 ) -> Tuple["Figure", List["Axes"], List["GridSpecBase"]]:
     """
     Given the ascii-art representation of the plot's layout,
@@ -148,6 +164,15 @@ def generate_layout(
     dpi (float, optional):
         Dots-per-inch of the figure. Defaults to 96.
 
+    pyplot (bool, optional):
+        Whether to create the figure through pyplot, which registers it with
+        pyplot's figure manager so that it must be closed with `plt.close`. If
+        False, a bare `Figure` with an Agg canvas is created instead; it is
+        garbage collected like any other object, and, as no pyplot state is
+        involved, it is safe to call this function from multiple threads with
+        matplotlib 3.6 or later (earlier versions share cached fonts between
+        threads, so rendering text concurrently is not safe). Defaults to True.
+
     Returns
     -------
     A tuple of three elements:
@@ -168,6 +193,7 @@ def generate_layout(
         width_factor=width_factor,
         height_factor=height_factor,
         dpi=dpi,
+        pyplot=pyplot,
     )
     src.seek(0)
 
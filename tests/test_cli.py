@@ -0,0 +1,27 @@
+"""
+Tests for the command line interface.
+"""
+from click.testing import CliRunner
+
+from matplotlib_autolayout.cli import main
+
+ART = "113\n223\n\n"
+
+
+def test_pyplot_by_default() -> None:
+    result = CliRunner().invoke(main, input=ART)
+    assert result.exit_code == 0
+    assert "fig = plt.figure(" in result.output
+
+
+def test_no_pyplot() -> None:
+    result = CliRunner().invoke(main, ["--no-pyplot"], input=ART)
+    assert result.exit_code == 0
+    assert "fig = Figure(" in result.output
+    assert "plt" not in result.output
+
+
+def test_show_requires_pyplot() -> None:
+    result = CliRunner().invoke(main, ["--show", "--no-pyplot"], input=ART)
+    assert result.exit_code != 0
+    assert "--show requires --pyplot" in result.output
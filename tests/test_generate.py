@@ -0,0 +1,93 @@
+"""
+Tests for the generation of the source code and of the layout.
+"""
+import gc
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from typing import Any, Dict
+
+import matplotlib
+import psutil
+import pytest
+
+from matplotlib_autolayout import generate_layout, generate_source_code
+
+MPL_VERSION = tuple(int(v) for v in matplotlib.__version__.split(".")[:2])
+
+ART = """
+113
+223
+"""
+
+
+def render(i: int) -> bytes:
+    """
+    Builds a pyplot-free layout, draws lines, titles and tick labels
+    depending on `i`, and returns the figure saved as png.
+    """
+    fig, axes, _ = generate_layout(ART, width=3, height=2, dpi=50, pyplot=False)
+    for name, ax in axes.items():
+        ax.plot(range(i % 5 + 2))
+        ax.set_title(f"{name} {i % 5}")
+    buf = BytesIO()
+    fig.savefig(buf, format="png")
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("pyplot", [True, False])
+def test_generated_source_runs_in_fresh_namespace(pyplot: bool) -> None:
+    src = StringIO()
+    generate_source_code(ART, file=src, pyplot=pyplot)
+
+    defs: Dict[str, Any] = {}
+    exec(src.getvalue(), defs)  # pylint: disable=exec-used
+
+    assert sorted(defs["axes"]) == ["ax_1", "ax_2", "ax_3"]
+    assert ("plt." in src.getvalue()) == pyplot
+    if pyplot:
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+        plt.close(defs["fig"])
+
+
+def test_no_pyplot_does_not_import_pyplot() -> None:
+    code = (
+        "import sys\n"
+        "from matplotlib_autolayout import generate_layout\n"
+        "fig, _, _ = generate_layout('12', pyplot=False)\n"
+        "fig.savefig(__import__('io').BytesIO(), format='png')\n"
+        "print('matplotlib.pyplot' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, stdout=subprocess.PIPE
+    )
+    assert out.stdout.decode().strip() == "False"
+
+
+@pytest.mark.stress
+@pytest.mark.skipif(
+    MPL_VERSION < (3, 6), reason="fonts are shared between threads before 3.6"
+)
+def test_no_pyplot_concurrent_stress() -> None:
+    batches, batch_size = 5, 400
+    expected = [render(i) for i in range(5)]
+    process = psutil.Process()
+
+    memory = []
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for b in range(batches):
+            indices = range(b * batch_size, (b + 1) * batch_size)
+            for i, png in zip(indices, pool.map(render, indices)):
+                assert png == expected[i % 5], f"figure {i} rendered differently"
+            gc.collect()
+            memory.append(process.memory_info().rss)
+
+    # the first batch warms up caches (fonts, text layouts, allocator arenas, ...)
+    growth = max(memory[1:]) - memory[0]
+    assert growth < 32 * 1024 ** 2, f"memory grew across batches: {memory}"
+
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+    assert plt.get_fignums() == []